@@ -0,0 +1,50 @@
+"""
+JSON backend selection
+Picks the fastest serializer available at import time — orjson, then ujson,
+then the stdlib json module — so deployments choose a backend purely by
+what is installed, with no code changes at the call sites
+"""
+
+import json
+
+try:
+    import orjson as _orjson
+
+    backend = 'orjson'
+    loads = _orjson.loads
+    DECODE_ERRORS = (json.JSONDecodeError, _orjson.JSONDecodeError)
+
+    def dumps_bytes(obj, pretty: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        # OPT_NON_STR_KEYS stringifies int/date dict keys like the other
+        # backends do, so behavior does not depend on which one is installed
+        option = _orjson.OPT_NON_STR_KEYS | (_orjson.OPT_INDENT_2 if pretty else 0)
+        return _orjson.dumps(obj, option=option)
+
+except ImportError:
+    try:
+        import ujson as _ujson
+
+        backend = 'ujson'
+        loads = _ujson.loads
+        DECODE_ERRORS = (
+            json.JSONDecodeError,
+            getattr(_ujson, 'JSONDecodeError', json.JSONDecodeError),
+        )
+
+        def dumps_bytes(obj, pretty: bool = False) -> bytes:
+            """Serialize obj to UTF-8 JSON bytes"""
+            return _ujson.dumps(
+                obj, indent=2 if pretty else 0, ensure_ascii=False
+            ).encode('utf-8')
+
+    except ImportError:
+        backend = 'json'
+        loads = json.loads
+        DECODE_ERRORS = (json.JSONDecodeError,)
+
+        def dumps_bytes(obj, pretty: bool = False) -> bytes:
+            """Serialize obj to UTF-8 JSON bytes"""
+            return json.dumps(
+                obj, indent=2 if pretty else None, ensure_ascii=False
+            ).encode('utf-8')
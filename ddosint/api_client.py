@@ -4,29 +4,82 @@ Handles all HTTP requests to the DDoSia Monitor API endpoints
 """
 
 import requests
-import json
-from typing import Dict, List, Optional, Any
+import re
+from typing import Dict, Iterator, List, Optional, Any
 from urllib.parse import urljoin
+from pathlib import Path
+
+from ddosint import _json
+from ddosint.cache import cached
+
+# requests-cache transparently caches responses on disk so repeated CLI
+# invocations skip the network entirely; optional, plain Session otherwise
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# ijson parses JSON incrementally from the response stream, letting huge
+# target lists be consumed without ever materializing them in memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_DATE_RE = re.compile(r'\A\d{4}-\d{2}-\d{2}\Z')
 
 
 class DDoSiaAPIClient:
     """Client for interacting with DDoSia Monitor API"""
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30, cache: bool = True):
         """
         Initialize the API client
-        
+
         Args:
             base_url: Base URL of the DDoSia Monitor instance (e.g., 'https://example.com')
             timeout: Request timeout in seconds
+            cache: Whether to cache responses on disk (requires requests-cache)
         """
         self.base_url = base_url.rstrip('/')
         self.api_base = f"{self.base_url}/api"
         self.timeout = timeout
-        self.session = requests.Session()
+        self.cache_enabled = cache
+        if cache and requests_cache is not None:
+            # SQLite-backed cache with per-endpoint TTLs: available dates
+            # change at most daily, stats every few minutes
+            self.session = requests_cache.CachedSession(
+                cache_name=str(Path.home() / '.cache' / 'ddosint' / 'http_cache'),
+                backend='sqlite',
+                expire_after=300,
+                urls_expire_after={
+                    '*/available_dates.php': 3600,
+                    '*/stats.php': 600,
+                }
+            )
+        else:
+            self.session = requests.Session()
+        # Size the connection pool for bulk/concurrent use and retry
+        # transient gateway errors; keep-alive reuses one TLS session
+        # across requests instead of handshaking each time
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=requests.adapters.Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504)
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'DDoSINT-CLI/1.0.0',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            # Advertise compression explicitly; large JSON bodies compress
+            # 5-10x. br is left out since urllib3 only decodes it when the
+            # optional brotli package is installed
+            'Accept-Encoding': 'gzip, deflate'
         })
     
     def _request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
@@ -50,7 +103,7 @@ class DDoSiaAPIClient:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json.loads(response.content)
             
             # Check for API-level errors
             if 'error' in data:
@@ -62,9 +115,10 @@ class DDoSiaAPIClient:
             raise requests.exceptions.RequestException(
                 f"Failed to connect to API: {str(e)}"
             )
-        except json.JSONDecodeError as e:
+        except _json.DECODE_ERRORS as e:
             raise ValueError(f"Invalid JSON response: {str(e)}")
     
+    @cached(ttl=600)
     def get_stats(self, stat_type: str = 'overview') -> Dict[str, Any]:
         """
         Get statistics from the API
@@ -78,6 +132,7 @@ class DDoSiaAPIClient:
         """
         return self._request('stats.php', {'type': stat_type})
     
+    @cached(ttl=120)
     def get_recent_targets(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Get recent targets (last 2 days)
@@ -113,12 +168,57 @@ class DDoSiaAPIClient:
             Targets data with stats for the specified date
         """
         # Validate date format
-        import re
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
+        if not _DATE_RE.match(date):
             raise ValueError("Date must be in YYYY-MM-DD format")
         
         return self._request('targets_by_date.php', {'date': date})
     
+    def iter_targets_by_date(self, date: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream targets for a specific date without loading the full response
+
+        Parses the 'targets' array incrementally with ijson while the body
+        is still downloading, so a multi-GB response never has to fit in
+        memory. The HTTP cache is bypassed on this path: CachedSession
+        would buffer the whole body to store it, defeating the streaming.
+        Note that per-date stats are not available on this path; use
+        get_targets_by_date when the full envelope is needed.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Yields:
+            Target dictionaries, one at a time
+
+        Raises:
+            RuntimeError: If ijson is not installed
+        """
+        if ijson is None:
+            raise RuntimeError(
+                "Streaming requires ijson. Install it with: pip install ijson"
+            )
+
+        # Validate date format
+        if not _DATE_RE.match(date):
+            raise ValueError("Date must be in YYYY-MM-DD format")
+
+        url = urljoin(f"{self.api_base}/", 'targets_by_date.php')
+        if requests_cache is not None and isinstance(self.session, requests_cache.CachedSession):
+            with self.session.cache_disabled():
+                response = self.session.get(
+                    url, params={'date': date}, timeout=self.timeout, stream=True
+                )
+        else:
+            response = self.session.get(
+                url, params={'date': date}, timeout=self.timeout, stream=True
+            )
+        response.raise_for_status()
+        # Let urllib3 decompress transparently so ijson sees plain JSON
+        response.raw.decode_content = True
+
+        yield from ijson.items(response.raw, 'targets.item')
+
+    @cached(ttl=600)
     def get_available_dates(self) -> List[Dict[str, Any]]:
         """
         Get list of available dates with data
@@ -0,0 +1,113 @@
+"""
+Async API Client for DDoSia Monitor
+Concurrent variant of DDoSiaAPIClient for bulk queries over many dates
+"""
+
+import asyncio
+import re
+from typing import Dict, List, Optional, Any
+
+import httpx
+
+_DATE_RE = re.compile(r'\A\d{4}-\d{2}-\d{2}\Z')
+
+
+class AsyncDDoSiaAPIClient:
+    """Async client for interacting with DDoSia Monitor API
+
+    Uses a single httpx.AsyncClient with HTTP/2 and connection keep-alive,
+    so N concurrent requests share one TLS session instead of paying a
+    handshake each. Use as an async context manager:
+
+        async with AsyncDDoSiaAPIClient(base_url) as client:
+            results = await asyncio.gather(
+                *(client.get_targets_by_date(d) for d in dates)
+            )
+    """
+
+    def __init__(self, base_url: str, timeout: int = 30):
+        """
+        Initialize the async API client
+
+        Args:
+            base_url: Base URL of the DDoSia Monitor instance (e.g., 'https://example.com')
+            timeout: Request timeout in seconds
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_base = f"{self.base_url}/api"
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            headers={
+                'User-Agent': 'DDoSINT-CLI/1.0.0',
+                'Accept': 'application/json'
+            }
+        )
+
+    async def __aenter__(self) -> 'AsyncDDoSiaAPIClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+    async def _request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Make a GET request to the API
+
+        Args:
+            endpoint: API endpoint path (e.g., 'stats.php')
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the API returns an error
+        """
+        url = f"{self.api_base}/{endpoint}"
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+
+        data = response.json()
+
+        # Check for API-level errors
+        if 'error' in data:
+            raise ValueError(f"API Error: {data['error']}")
+
+        return data
+
+    async def get_targets_by_date(self, date: str) -> Dict[str, Any]:
+        """
+        Get all targets for a specific date
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            Targets data with stats for the specified date
+        """
+        if not _DATE_RE.match(date):
+            raise ValueError("Date must be in YYYY-MM-DD format")
+
+        return await self._request('targets_by_date.php', {'date': date})
+
+    async def get_targets_for_dates(self, dates: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch targets for many dates concurrently
+
+        Args:
+            dates: List of dates in YYYY-MM-DD format
+
+        Returns:
+            List of per-date results, in the same order as the input dates
+        """
+        return await asyncio.gather(
+            *(self.get_targets_by_date(date) for date in dates)
+        )
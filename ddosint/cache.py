@@ -0,0 +1,62 @@
+"""
+On-disk result cache for API client methods
+Lets repeated short-lived CLI invocations reuse recent responses without
+touching the network at all
+"""
+
+import functools
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE_DIR = Path.home() / '.cache' / 'ddosint' / 'results'
+
+
+def cached(ttl: int = 600) -> Callable:
+    """
+    Decorator caching a client method's JSON-serializable result on disk
+
+    The cache key is derived from the client's base URL, the method name,
+    and its arguments; entries older than ttl seconds are refetched. The
+    cache is skipped entirely when the client was created with cache=False.
+
+    Args:
+        ttl: Time-to-live for cached entries, in seconds
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs) -> Any:
+            if not getattr(self, 'cache_enabled', True):
+                return func(self, *args, **kwargs)
+
+            key_source = json.dumps(
+                [getattr(self, 'base_url', ''), func.__name__, args, kwargs],
+                sort_keys=True,
+                default=str
+            )
+            key = hashlib.sha1(key_source.encode('utf-8')).hexdigest()
+            cache_file = CACHE_DIR / f"{key}.json"
+
+            try:
+                if time.time() - cache_file.stat().st_mtime < ttl:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                # Missing, expired, or corrupt entry: fall through to fetch
+                pass
+
+            result = func(self, *args, **kwargs)
+
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(result, f)
+            except OSError:
+                # Caching is best-effort; never fail the actual call
+                pass
+
+            return result
+        return wrapper
+    return decorator
@@ -3,26 +3,58 @@ Command-line interface for DDoSINT
 """
 
 import argparse
+import concurrent.futures
+import operator
 import sys
 import os
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+from datetime import datetime, timedelta
 
-from ddosint.api_client import DDoSiaAPIClient
-from ddosint.export import DataExporter
+# The API client (and with it requests) and the exporter are imported
+# lazily inside the handlers that need them, keeping startup fast for
+# --help and commands that never export
+if TYPE_CHECKING:
+    from ddosint.api_client import DDoSiaAPIClient
+    from ddosint.export import DataExporter
+
+STAT_TYPES = ['overview', 'by_year', 'by_month', 'by_day',
+              'timeseries_monthly', 'timeseries_daily']
 
 
 class DDoSINTCLI:
     """Main CLI class"""
     
     def __init__(self):
-        self.client: Optional[DDoSiaAPIClient] = None
-        self.exporter = DataExporter()
-    
-    def setup_client(self, base_url: str) -> None:
+        self.client: Optional['DDoSiaAPIClient'] = None
+        self._exporter: Optional['DataExporter'] = None
+        self._output_dir: Optional[Path] = None
+        self._output_dir_raw: Optional[str] = None
+
+    @property
+    def exporter(self) -> 'DataExporter':
+        """Lazily constructed DataExporter"""
+        if self._exporter is None:
+            from ddosint.export import DataExporter
+            self._exporter = DataExporter()
+        return self._exporter
+
+    def setup_client(self, base_url: str, cache: bool = True) -> None:
         """Initialize API client"""
-        self.client = DDoSiaAPIClient(base_url)
+        from ddosint.api_client import DDoSiaAPIClient
+        self.client = DDoSiaAPIClient(base_url, cache=cache)
+
+    def _resolve_output_dir(self, args: argparse.Namespace) -> Path:
+        """Resolve the export output directory, caching the result
+
+        resolve() stats every path component, so the resolved Path is
+        reused as long as the requested directory does not change.
+        """
+        raw = getattr(args, 'output_dir', None) or os.getcwd()
+        if self._output_dir is None or raw != self._output_dir_raw:
+            self._output_dir_raw = raw
+            self._output_dir = Path(raw).expanduser().resolve()
+        return self._output_dir
     
     def cmd_extract(self, args: argparse.Namespace) -> int:
         """
@@ -35,9 +67,29 @@ class DDoSINTCLI:
             Exit code (0 for success, 1 for error)
         """
         if not self.client:
-            self.setup_client(args.base_url)
+            self.setup_client(args.base_url, cache=not args.no_cache)
         
         try:
+            if args.stream and args.format == 'csv':
+                # Stream targets straight from the response into the CSV
+                # writer; nothing is buffered, but no stats are available
+                print(f"Streaming targets for date: {args.date}")
+                output_dir = self._resolve_output_dir(args)
+                output_file = self.exporter.export_csv(
+                    self.client.iter_targets_by_date(args.date),
+                    output_dir / f"{args.prefix}_{args.date}.csv",
+                    compress=args.gzip
+                )
+                print(f"\n✓ Export completed successfully!")
+                print(f"  Date: {args.date}")
+                print(f"  Format: CSV (streamed)")
+                print(f"  Output: {output_file}")
+                return 0
+
+            if args.stream:
+                print("Note: --stream only applies to CSV output, ignoring",
+                      file=sys.stderr)
+
             print(f"Fetching targets for date: {args.date}")
             data = self.client.get_targets_by_date(args.date)
             
@@ -46,17 +98,18 @@ class DDoSINTCLI:
                 return 1
             
             # Determine output directory
-            output_dir = args.output_dir or os.getcwd()
-            output_dir = Path(output_dir).expanduser().resolve()
-            
+            output_dir = self._resolve_output_dir(args)
+
             # Export data
             output_file = self.exporter.export_targets_by_date(
                 data,
                 str(output_dir),
                 format=args.format,
-                filename_prefix=args.prefix
+                filename_prefix=args.prefix,
+                pretty=args.pretty,
+                compress=args.gzip
             )
-            
+
             # Print summary
             stats = data.get('stats', {})
             print(f"\n✓ Export completed successfully!")
@@ -76,6 +129,83 @@ class DDoSINTCLI:
             print(f"Unexpected error: {e}", file=sys.stderr)
             return 1
     
+    def cmd_extract_range(self, args: argparse.Namespace) -> int:
+        """
+        Extract targets for a range of dates, fetching all dates concurrently
+
+        Args:
+            args: Parsed command-line arguments
+
+        Returns:
+            Exit code (0 for success, 1 for error)
+        """
+        try:
+            import asyncio
+            from ddosint.async_client import AsyncDDoSiaAPIClient
+        except ImportError:
+            print(
+                "Error: extract-range requires httpx. "
+                "Install it with: pip install 'ddosint[async]'",
+                file=sys.stderr
+            )
+            return 1
+
+        try:
+            start = datetime.strptime(args.from_date, '%Y-%m-%d')
+            end = datetime.strptime(args.to_date, '%Y-%m-%d')
+        except ValueError:
+            print("Error: Dates must be in YYYY-MM-DD format", file=sys.stderr)
+            return 1
+
+        if start > end:
+            print("Error: --from date must not be after --to date", file=sys.stderr)
+            return 1
+
+        dates = []
+        current = start
+        while current <= end:
+            dates.append(current.strftime('%Y-%m-%d'))
+            current += timedelta(days=1)
+
+        async def fetch_all():
+            async with AsyncDDoSiaAPIClient(args.base_url) as client:
+                return await client.get_targets_for_dates(dates)
+
+        try:
+            print(f"Fetching targets for {len(dates)} dates ({dates[0]} to {dates[-1]})")
+            results = asyncio.run(fetch_all())
+
+            # Determine output directory
+            output_dir = self._resolve_output_dir(args)
+
+            exported = 0
+            for date, data in zip(dates, results):
+                if not data.get('targets'):
+                    print(f"  {date}: no targets, skipped")
+                    continue
+
+                output_file = self.exporter.export_targets_by_date(
+                    data,
+                    str(output_dir),
+                    format=args.format,
+                    filename_prefix=args.prefix,
+                    pretty=args.pretty,
+                    compress=args.gzip
+                )
+                stats = data.get('stats', {})
+                print(f"  {date}: {stats.get('total_targets', 0)} targets -> {output_file}")
+                exported += 1
+
+            print(f"\n✓ Exported {exported}/{len(dates)} dates")
+            return 0 if exported else 1
+
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        except Exception as e:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+            return 1
+
     def cmd_search(self, args: argparse.Namespace) -> int:
         """
         Search for targets by host
@@ -87,8 +217,10 @@ class DDoSINTCLI:
             Exit code (0 for success, 1 for error)
         """
         if not self.client:
-            self.setup_client(args.base_url)
+            self.setup_client(args.base_url, cache=not args.no_cache)
         
+        safe_host = args.host.replace('.', '_')
+
         try:
             print(f"Searching for host: {args.host}")
             data = self.client.search_host(args.host)
@@ -117,18 +249,20 @@ class DDoSINTCLI:
             
             # Export if requested
             if args.export:
-                output_dir = args.output_dir or os.getcwd()
-                output_dir = Path(output_dir).expanduser().resolve()
-                
+                output_dir = self._resolve_output_dir(args)
+
                 if args.format == 'json':
                     output_file = self.exporter.export_json(
                         data,
-                        output_dir / f"search_{args.host.replace('.', '_')}.json"
+                        output_dir / f"search_{safe_host}.json",
+                        pretty=args.pretty,
+                        compress=args.gzip
                     )
                 elif args.format == 'csv':
                     output_file = self.exporter.export_csv(
                         targets,
-                        output_dir / f"search_{args.host.replace('.', '_')}.csv"
+                        output_dir / f"search_{safe_host}.csv",
+                        compress=args.gzip
                     )
                 
                 print(f"\n✓ Exported to: {output_file}")
@@ -142,56 +276,92 @@ class DDoSINTCLI:
             print(f"Unexpected error: {e}", file=sys.stderr)
             return 1
     
+    def _print_stats(self, stat_type: str, data) -> None:
+        """Render one statistics result to stdout"""
+        if stat_type == 'overview':
+            print("\n=== Overview Statistics ===")
+            print(f"Total Targets: {data.get('total_targets', 0)}")
+            print(f"Total Requests: {data.get('total_requests', 0)}")
+            print(f"Total Hosts: {data.get('total_hosts', 0)}")
+            print(f"Total IPs: {data.get('total_ips', 0)}")
+            print(f"Total Imports: {data.get('total_imports', 0)}")
+            print(f"Last Detected: {data.get('last_detected', 'N/A')}")
+        else:
+            # Print as table
+            print(f"\n=== Statistics ({stat_type}) ===")
+            if isinstance(data, list) and data:
+                # Build header and all rows, then write them in one go.
+                # itemgetter extracts all cells of a row in one C call
+                # instead of a Python-level .get per cell; rows missing
+                # keys are normalized first
+                keys = list(data[0].keys())
+                header = " | ".join(keys)
+                lines = [header, "-" * (len(header) + 10)]
+
+                if keys:
+                    key_set = set(keys)
+                    get_values = operator.itemgetter(*keys)
+
+                    def row_values(row):
+                        # Compare key sets, not counts: a row with the same
+                        # number of keys but different names must also be
+                        # normalized or itemgetter raises KeyError
+                        if row.keys() != key_set:
+                            row = {k: row.get(k, '') for k in keys}
+                        values = get_values(row)
+                        return values if len(keys) > 1 else (values,)
+
+                    lines.extend(
+                        " | ".join(map(str, row_values(row)))
+                        for row in data
+                    )
+                else:
+                    # Empty first row: no columns, emit blank cells as before
+                    lines.extend('' for _ in data)
+
+                sys.stdout.write('\n'.join(lines) + '\n')
+
     def cmd_stats(self, args: argparse.Namespace) -> int:
         """
-        Display statistics
-        
+        Display statistics for one type, or all types concurrently
+
         Args:
             args: Parsed command-line arguments
-            
+
         Returns:
             Exit code (0 for success, 1 for error)
         """
         if not self.client:
-            self.setup_client(args.base_url)
+            self.setup_client(args.base_url, cache=not args.no_cache)
         
         try:
-            data = self.client.get_stats(args.type)
-            
-            if args.type == 'overview':
-                print("\n=== Overview Statistics ===")
-                print(f"Total Targets: {data.get('total_targets', 0)}")
-                print(f"Total Requests: {data.get('total_requests', 0)}")
-                print(f"Total Hosts: {data.get('total_hosts', 0)}")
-                print(f"Total IPs: {data.get('total_ips', 0)}")
-                print(f"Total Imports: {data.get('total_imports', 0)}")
-                print(f"Last Detected: {data.get('last_detected', 'N/A')}")
+            if args.all:
+                # One thread per stat type: requests releases the GIL during
+                # I/O, so the six RTT-bound calls overlap on the shared
+                # keep-alive pool
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(STAT_TYPES)) as ex:
+                    results = dict(zip(STAT_TYPES, ex.map(self.client.get_stats, STAT_TYPES)))
             else:
-                # Print as table
-                print(f"\n=== Statistics ({args.type}) ===")
-                if isinstance(data, list) and data:
-                    # Print header
-                    keys = list(data[0].keys())
-                    print(" | ".join(keys))
-                    print("-" * (len(" | ".join(keys)) + 10))
-                    # Print rows
-                    for row in data:
-                        values = [str(row.get(k, '')) for k in keys]
-                        print(" | ".join(values))
-            
+                results = {args.type: self.client.get_stats(args.type)}
+
+            for stat_type, data in results.items():
+                self._print_stats(stat_type, data)
+
             # Export if requested
             if args.export:
-                output_dir = args.output_dir or os.getcwd()
-                output_dir = Path(output_dir).expanduser().resolve()
-                
-                output_file = self.exporter.export_json(
-                    data,
-                    output_dir / f"stats_{args.type}.json"
-                )
-                print(f"\n✓ Exported to: {output_file}")
-            
+                output_dir = self._resolve_output_dir(args)
+
+                for stat_type, data in results.items():
+                    output_file = self.exporter.export_json(
+                        data,
+                        output_dir / f"stats_{stat_type}.json",
+                        pretty=args.pretty,
+                        compress=args.gzip
+                    )
+                    print(f"\n✓ Exported to: {output_file}")
+
             return 0
-            
+
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
@@ -210,7 +380,7 @@ class DDoSINTCLI:
             Exit code (0 for success, 1 for error)
         """
         if not self.client:
-            self.setup_client(args.base_url)
+            self.setup_client(args.base_url, cache=not args.no_cache)
         
         try:
             dates = self.client.get_available_dates()
@@ -223,11 +393,13 @@ class DDoSINTCLI:
             print("Date       | Targets | Requests")
             print("-" * 40)
             
-            for date_info in dates[:args.limit] if args.limit else dates:
-                date = date_info.get('date', 'N/A')
-                targets = date_info.get('target_count', 0)
-                requests = date_info.get('request_count', 0)
-                print(f"{date} | {targets:7d} | {requests:8d}")
+            # Build all rows and write them in one go; per-row print() would
+            # acquire the stdout lock and flush once per line on a tty
+            lines = [
+                f"{d.get('date', 'N/A')} | {d.get('target_count', 0):7d} | {d.get('request_count', 0):8d}"
+                for d in (dates[:args.limit] if args.limit else dates)
+            ]
+            sys.stdout.write('\n'.join(lines) + '\n')
             
             if args.limit and len(dates) > args.limit:
                 print(f"\n... and {len(dates) - args.limit} more dates")
@@ -269,6 +441,11 @@ Examples:
         default=os.getenv('DDOSIA_BASE_URL', 'https://ddosia.rfeed.it'),
         help='Base URL of DDoSia Monitor instance (default: from DDOSIA_BASE_URL env var or https://ddosia.rfeed.it)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable on-disk HTTP response caching'
+    )
     
     # Subcommands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -291,7 +468,66 @@ Examples:
         default='targets',
         help='Filename prefix (default: targets)'
     )
-    
+    extract_parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent JSON output (default: compact)'
+    )
+    extract_parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Compress the output file with gzip (adds .gz extension)'
+    )
+    extract_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream CSV rows directly from the response without buffering '
+             'the full target list in memory (requires ijson, CSV only)'
+    )
+
+    # Extract-range command
+    range_parser = subparsers.add_parser(
+        'extract-range',
+        help='Extract targets for a range of dates (fetched concurrently)'
+    )
+    range_parser.add_argument(
+        '--from',
+        dest='from_date',
+        required=True,
+        help='Start date in YYYY-MM-DD format (inclusive)'
+    )
+    range_parser.add_argument(
+        '--to',
+        dest='to_date',
+        required=True,
+        help='End date in YYYY-MM-DD format (inclusive)'
+    )
+    range_parser.add_argument(
+        '--format',
+        choices=['json', 'csv'],
+        default='json',
+        help='Output format (default: json)'
+    )
+    range_parser.add_argument(
+        '--output-dir',
+        help='Output directory (default: current directory)'
+    )
+    range_parser.add_argument(
+        '--prefix',
+        default='targets',
+        help='Filename prefix (default: targets)'
+    )
+    range_parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent JSON output (default: compact)'
+    )
+    range_parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Compress the output files with gzip (adds .gz extension)'
+    )
+
     # Search command
     search_parser = subparsers.add_parser('search', help='Search for targets by host')
     search_parser.add_argument('host', help='Host name or partial match')
@@ -315,13 +551,30 @@ Examples:
         '--output-dir',
         help='Output directory (default: current directory)'
     )
+    search_parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent exported JSON (default: compact)'
+    )
+    search_parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Compress the exported file with gzip (adds .gz extension)'
+    )
     
     # Stats command
     stats_parser = subparsers.add_parser('stats', help='Display statistics')
     stats_parser.add_argument(
         'type',
-        choices=['overview', 'by_year', 'by_month', 'by_day', 'timeseries_monthly', 'timeseries_daily'],
-        help='Type of statistics to retrieve'
+        nargs='?',
+        default='overview',
+        choices=STAT_TYPES,
+        help='Type of statistics to retrieve (default: overview)'
+    )
+    stats_parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Fetch all statistics types concurrently'
     )
     stats_parser.add_argument(
         '--export',
@@ -332,6 +585,16 @@ Examples:
         '--output-dir',
         help='Output directory (default: current directory)'
     )
+    stats_parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent exported JSON (default: compact)'
+    )
+    stats_parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Compress the exported file with gzip (adds .gz extension)'
+    )
     
     # Dates command
     dates_parser = subparsers.add_parser('dates', help='List available dates with data')
@@ -353,6 +616,8 @@ Examples:
     # Execute command
     if args.command == 'extract':
         return cli.cmd_extract(args)
+    elif args.command == 'extract-range':
+        return cli.cmd_extract_range(args)
     elif args.command == 'search':
         return cli.cmd_search(args)
     elif args.command == 'stats':
@@ -2,70 +2,137 @@
 Export utilities for saving data in various formats
 """
 
-import json
 import csv
+import gzip
 import os
-from typing import List, Dict, Any
+from itertools import chain, islice
+from typing import Dict, Any, Iterable
 from pathlib import Path
 from datetime import datetime
 
+from ddosint import _json
+
+# pyarrow can emit CSV entirely in C, worthwhile only for large exports
+# where the conversion cost is amortized; optional like orjson
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+# Exports can be multiple MB; a 1 MiB write buffer batches the many small
+# writes from the json/csv serializers into far fewer syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum row count before the pyarrow CSV path pays off
+_PYARROW_CSV_THRESHOLD = 10000
+
 
 class DataExporter:
     """Handle data export to JSON and CSV formats"""
     
     @staticmethod
-    def export_json(data: Any, output_path: str, pretty: bool = True) -> str:
+    def export_json(data: Any, output_path: str, pretty: bool = False,
+                    compress: bool = False) -> str:
         """
         Export data to JSON file
-        
+
         Args:
             data: Data to export (dict, list, etc.)
             output_path: Full path to output file
-            pretty: Whether to format JSON with indentation
-            
+            pretty: Whether to format JSON with indentation; compact output
+                    is the default since it is smaller and faster to write
+            compress: Whether to gzip the output (appends .gz to the
+                      filename; fast compresslevel=1 keeps it off the
+                      critical path)
+
         Returns:
             Path to the created file
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(data, f, ensure_ascii=False)
-        
+        if compress:
+            output_path = output_path.with_name(output_path.name + '.gz')
+
+        payload = _json.dumps_bytes(data, pretty=pretty)
+        if compress:
+            f = gzip.open(output_path, 'wb', compresslevel=1)
+        else:
+            f = open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE)
+        with f:
+            f.write(payload)
+
         return str(output_path)
     
     @staticmethod
-    def export_csv(targets: List[Dict[str, Any]], output_path: str) -> str:
+    def export_csv(targets: Iterable[Dict[str, Any]], output_path: str,
+                   compress: bool = False) -> str:
         """
-        Export targets list to CSV file
-        
+        Export targets to CSV file in a single streaming pass
+
+        Fieldnames are determined from a sample of the first 1024 targets,
+        so the input can be any iterable (including a generator) and is
+        never fully buffered in memory. Keys appearing only after the
+        sample are silently dropped from the output.
+
         Args:
-            targets: List of target dictionaries
+            targets: Iterable of target dictionaries
             output_path: Full path to output file
-            
+            compress: Whether to gzip the output (appends .gz to the filename)
+
         Returns:
             Path to the created file
         """
-        if not targets:
+        if (pyarrow is not None and not compress and isinstance(targets, list)
+                and len(targets) > _PYARROW_CSV_THRESHOLD):
+            # Large list: let pyarrow build and write the table in C,
+            # skipping the per-row Python loop; missing keys become nulls
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                table = pyarrow.Table.from_pylist(targets)
+                pyarrow.csv.write_csv(table, str(output_path))
+                return str(output_path)
+            except Exception:
+                # pyarrow needs uniform column types (ArrowInvalid on e.g.
+                # a port that is int in some rows and str in others); the
+                # fast path is best-effort, so fall through to the stdlib
+                # writer which handles such data fine
+                pass
+
+        targets = iter(targets)
+        sample = list(islice(targets, 1024))
+        if not sample:
             raise ValueError("No targets to export")
-        
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Get all unique keys from all targets
-        fieldnames = set()
-        for target in targets:
-            fieldnames.update(target.keys())
-        fieldnames = sorted(list(fieldnames))
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(targets)
-        
+
+        # Get all unique keys from the sampled targets in one pass;
+        # dict.fromkeys dedupes while keeping first-occurrence order, so
+        # columns follow the API's natural field order instead of being sorted
+        fieldnames = list(dict.fromkeys(
+            key for target in sample for key in target
+        ))
+
+        if compress:
+            output_path = output_path.with_name(output_path.name + '.gz')
+            f = gzip.open(output_path, 'wt', encoding='utf-8', newline='',
+                          compresslevel=1)
+        else:
+            f = open(output_path, 'w', newline='', encoding='utf-8',
+                     buffering=_WRITE_BUFFER_SIZE)
+        with f:
+            # Plain csv.writer with precomputed positional rows avoids
+            # DictWriter's per-row fieldname re-mapping; extra keys outside
+            # the sampled fieldnames are dropped by the .get lookups
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                [target.get(key, '') for key in fieldnames]
+                for target in chain(sample, targets)
+            )
+
         return str(output_path)
     
     @staticmethod
@@ -73,17 +140,21 @@ class DataExporter:
         api_data: Dict[str, Any],
         output_dir: str,
         format: str = 'json',
-        filename_prefix: str = 'targets'
+        filename_prefix: str = 'targets',
+        pretty: bool = False,
+        compress: bool = False
     ) -> str:
         """
         Export targets by date data to file
-        
+
         Args:
             api_data: Data from get_targets_by_date API call
             output_dir: Directory to save the file
             format: Export format ('json' or 'csv')
             filename_prefix: Prefix for the output filename
-            
+            pretty: Whether to indent JSON output (ignored for CSV)
+            compress: Whether to gzip the output file
+
         Returns:
             Path to the created file
         """
@@ -97,13 +168,14 @@ class DataExporter:
             # Export full API response as JSON
             filename = f"{filename_prefix}_{date}.json"
             output_path = output_dir / filename
-            return DataExporter.export_json(api_data, output_path)
+            return DataExporter.export_json(api_data, output_path, pretty=pretty,
+                                            compress=compress)
         
         elif format.lower() == 'csv':
             # Export only targets list as CSV
             filename = f"{filename_prefix}_{date}.csv"
             output_path = output_dir / filename
-            return DataExporter.export_csv(targets, output_path)
+            return DataExporter.export_csv(targets, output_path, compress=compress)
         
         else:
             raise ValueError(f"Unsupported format: {format}. Use 'json' or 'csv'")